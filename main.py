@@ -26,6 +26,7 @@ ALPACA_PAPER                = true/false (default: true)
 KRAKEN_API_KEY
 KRAKEN_API_SECRET
 KRAKEN_BASE_ASSET           = ZUSD by default (base currency for TradeBalance)
+KRAKEN_TICKER_TTL_SECONDS   = how long Earn wallet spot prices are reused (default: 60)
 
 OANDA_API_KEY
 OANDA_ACCOUNT_ID
@@ -37,12 +38,18 @@ UPDATE_INTERVAL_SECONDS     = optional; if set, the bot loops with that interval
 
 import os
 import json
+import asyncio
+import functools
+import hashlib
 import logging
 import time
+from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
+from zoneinfo import ZoneInfo
 
-import pytz
 import gspread
+from gspread.utils import absolute_range_name
 from google.oauth2.service_account import Credentials
 
 from alpaca.trading.client import TradingClient
@@ -67,69 +74,233 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive",
 ]
 
-logging.basicConfig(
-    level=os.getenv("LOG_LEVEL", "INFO"),
-    format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+
+# ---------- Logging ----------
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs strftime at most once per second of log time."""
+
+    _cached_time = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        if self._cached_time[0] != second:
+            ct = self.converter(record.created)
+            self._cached_time = (second, time.strftime(self.default_time_format, ct))
+        return self.default_msec_format % (self._cached_time[1], record.msecs)
+
+
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    _CachedTimeFormatter("%(asctime)s [%(levelname)s] %(name)s - %(message)s")
 )
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"), handlers=[_log_handler])
+
+# None of these record fields are in our format; skip collecting them (the
+# caller stack walk behind _srcfile is the most expensive part of a record).
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging._srcfile = None
 logger = logging.getLogger("account-dashboard-bot")
 
+MOUNTAIN_TZ = ZoneInfo("America/Denver")
+
+
+# ---------- Configuration ----------
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Env-derived settings, parsed and coerced once at startup.
+
+    Credentials are kept out of repr() so a logged Config doesn't leak them.
+    """
+
+    google_service_account_json: str | None = field(repr=False)
+    google_sheet_name: str
+    google_worksheet_name: str
+
+    alpaca_api_key: str | None = field(repr=False)
+    alpaca_api_secret: str | None = field(repr=False)
+    alpaca_paper: bool
+
+    kraken_api_key: str | None = field(repr=False)
+    kraken_api_secret: str | None = field(repr=False)
+    kraken_base_asset: str
+    kraken_base_alt: str
+    kraken_ticker_ttl_seconds: float
+
+    oanda_api_key: str | None = field(repr=False)
+    oanda_account_id: str | None
+    oanda_env: str
+
+    update_interval_seconds: int | None
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Read every setting from the environment (see module docstring)."""
+        interval_str = os.getenv("UPDATE_INTERVAL_SECONDS")
+        interval = None
+        if interval_str:
+            try:
+                interval = int(interval_str)
+            except ValueError:
+                raise RuntimeError(
+                    "UPDATE_INTERVAL_SECONDS must be an integer (seconds)"
+                )
+
+        try:
+            ticker_ttl = float(os.getenv("KRAKEN_TICKER_TTL_SECONDS", "60"))
+        except ValueError:
+            raise RuntimeError("KRAKEN_TICKER_TTL_SECONDS must be a number (seconds)")
+
+        alpaca_paper = os.getenv("ALPACA_PAPER", "true").lower() in {"1", "true", "yes"}
+        kraken_base_asset = os.getenv("KRAKEN_BASE_ASSET", "ZUSD")
+
+        return cls(
+            google_service_account_json=os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON"),
+            google_sheet_name=os.getenv("GOOGLE_SHEET_NAME", "Active-Investing"),
+            google_worksheet_name=os.getenv(
+                "GOOGLE_WORKSHEET_NAME", "Dashboard Control tab"
+            ),
+            alpaca_api_key=os.getenv("ALPACA_API_KEY"),
+            alpaca_api_secret=os.getenv("ALPACA_API_SECRET"),
+            alpaca_paper=alpaca_paper,
+            kraken_api_key=os.getenv("KRAKEN_API_KEY"),
+            kraken_api_secret=os.getenv("KRAKEN_API_SECRET"),
+            kraken_base_asset=kraken_base_asset,
+            kraken_base_alt=_kraken_base_alt_name(kraken_base_asset),
+            kraken_ticker_ttl_seconds=ticker_ttl,
+            oanda_api_key=os.getenv("OANDA_API_KEY"),
+            oanda_account_id=os.getenv("OANDA_ACCOUNT_ID"),
+            oanda_env=os.getenv("OANDA_ENV", "practice"),  # 'practice' or 'live'
+            update_interval_seconds=interval,
+        )
+
 
 # ---------- Time helpers ----------
 
 
 def get_mountain_timestamp() -> str:
     """Return current time in America/Denver as a nice string."""
-    tz = pytz.timezone("America/Denver")
-    now = datetime.now(tz)
+    now = datetime.now(MOUNTAIN_TZ)
     return now.strftime("%Y-%m-%d %H:%M:%S %Z")
 
 
 # ---------- Google Sheets helpers ----------
 
 
-def get_gspread_client():
+def get_gspread_client(cfg: Config):
     """Create an authenticated gspread client using a service account JSON in env."""
-    sa_json = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON")
+    sa_json = cfg.google_service_account_json
     if not sa_json:
         raise RuntimeError(
             "GOOGLE_SERVICE_ACCOUNT_JSON env var is not set. "
             "Put your service account JSON contents in this variable."
         )
 
-    info = json.loads(sa_json)
-    creds = Credentials.from_service_account_info(info, scopes=SCOPES)
-    gc = gspread.authorize(creds)
+    gc = gspread.authorize(_service_account_credentials(sa_json))
     return gc
 
 
-def get_dashboard_worksheet(gc):
-    """Open the target sheet + worksheet."""
-    sheet_name = os.getenv("GOOGLE_SHEET_NAME", "Active-Investing")
-    worksheet_name = os.getenv("GOOGLE_WORKSHEET_NAME", "Dashboard Control tab")
+@functools.lru_cache(maxsize=1)
+def _service_account_credentials(sa_json: str) -> Credentials:
+    """Parse the service account JSON and build Credentials once per process.
 
-    sh = gc.open(sheet_name)
-    ws = sh.worksheet(worksheet_name)
+    Re-authorizing after an auth error reuses these; they refresh their own
+    access token.
+    """
+    info = json.loads(sa_json)
+    return Credentials.from_service_account_info(info, scopes=SCOPES)
+
+
+def get_dashboard_worksheet(gc, cfg: Config):
+    """Open the target sheet + worksheet."""
+    sh = gc.open(cfg.google_sheet_name)
+    ws = sh.worksheet(cfg.google_worksheet_name)
     return ws
 
 
+# Built on first use and reused for the life of the process; the client's
+# auth transport refreshes its token on its own.
+_worksheet = None
+
+
+def get_cached_worksheet(cfg: Config):
+    """Return the dashboard worksheet, authorizing + opening it only once."""
+    global _worksheet
+    if _worksheet is None:
+        _worksheet = get_dashboard_worksheet(get_gspread_client(cfg), cfg)
+    return _worksheet
+
+
+def reset_cached_worksheet():
+    """Drop the cached worksheet so the next update re-authorizes."""
+    global _worksheet
+    _worksheet = None
+
+
+def _is_auth_error(exc: gspread.exceptions.APIError) -> bool:
+    """True if a Sheets API error means our credentials were rejected."""
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status in {401, 403}
+
+
 # ---------- Broker API helpers ----------
+#
+# Clients are built once and reused so their HTTP sessions (and keep-alive
+# connections) survive across loop iterations. Each returns None when the
+# broker isn't configured.
 
 
-def get_alpaca_snapshot():
+@functools.lru_cache(maxsize=1)
+def _alpaca_client(cfg: Config):
+    if not cfg.alpaca_api_key or not cfg.alpaca_api_secret:
+        return None
+
+    return TradingClient(
+        cfg.alpaca_api_key, cfg.alpaca_api_secret, paper=cfg.alpaca_paper
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _kraken_user(cfg: Config):
+    if not cfg.kraken_api_key or not cfg.kraken_api_secret:
+        return None
+
+    return KrakenUser(key=cfg.kraken_api_key, secret=cfg.kraken_api_secret)
+
+
+@functools.lru_cache(maxsize=1)
+def _kraken_market():
+    return KrakenMarket()  # unauthenticated is fine for public price data
+
+
+@functools.lru_cache(maxsize=1)
+def _oanda_client(cfg: Config):
+    if not cfg.oanda_api_key:
+        return None
+
+    return oandapyV20.API(access_token=cfg.oanda_api_key, environment=cfg.oanda_env)
+
+
+def get_alpaca_snapshot(cfg: Config):
     """Return account value + available funds for Alpaca, or None if not configured.
 
     - account_value   -> account.equity
     - available_funds -> account.buying_power
     """
-    api_key = os.getenv("ALPACA_API_KEY")
-    api_secret = os.getenv("ALPACA_API_SECRET")
+    trading_client = _alpaca_client(cfg)
 
-    if not api_key or not api_secret:
+    if trading_client is None:
         logger.info("Skipping Alpaca: missing ALPACA_API_KEY / ALPACA_API_SECRET")
         return None
 
-    paper_flag = os.getenv("ALPACA_PAPER", "true").lower() in {"1", "true", "yes"}
-    trading_client = TradingClient(api_key, api_secret, paper=paper_flag)
     account = trading_client.get_account()
 
     equity = float(account.equity)
@@ -158,8 +329,191 @@ def _kraken_base_alt_name(base_asset: str) -> str:
     return mapping.get(base_asset, base_asset)
 
 
-def get_kraken_earn_wallet_value(user: KrakenUser, base_asset: str) -> float:
-    """Return the total value (in base_asset) of Kraken *Earn wallet* balances.
+# Spot prices used to value the Earn wallet, keyed by pair ('DOTUSD'), as
+# (price, time.monotonic() when fetched). Earn balances barely move tick to
+# tick, so prices a few seconds old are fine and save the Ticker request.
+_ticker_cache: dict[str, tuple[float, float]] = {}
+
+# Pairs Kraken rejected as unknown, as pair -> time.monotonic() of the
+# rejection. They aren't requested again until the ticker TTL has passed.
+_unknown_pairs: dict[str, float] = {}
+
+
+def _ticker_last_price(ticker_entry) -> float:
+    """Return the last trade close price from a single Kraken ticker entry."""
+    return float(ticker_entry["c"][0])
+
+
+def _match_ticker_key(key: str, underlyings, base_asset: str, base_alt: str):
+    """Map a canonical Kraken pair name back to the requested underlying.
+
+    Kraken answers 'XBTUSD' with 'XXBTZUSD', 'EURUSD' with 'ZEURZUSD' and
+    'DOTUSD' with 'DOTUSD', so strip the quote currency and allow for the
+    legacy 'X' (crypto) / 'Z' (fiat) asset prefix.
+    """
+    for quote in (base_asset, base_alt):
+        if key.endswith(quote):
+            prefix = key[: -len(quote)]
+            if prefix in underlyings:
+                return prefix
+            if prefix[:1] in ("X", "Z") and prefix[1:] in underlyings:
+                return prefix[1:]
+    return None
+
+
+def _get_kraken_price(market: KrakenMarket, underlying: str, base_alt: str):
+    """Fetch the spot price of a single underlying/base pair, or None."""
+    pair_alt = f"{underlying}{base_alt}"  # e.g. 'DOTUSD', 'ETHUSD'
+    try:
+        ticker = market.get_ticker(pair=pair_alt)
+    except (KrakenUnknownAssetError, KrakenUnknownAssetPairError):
+        logger.warning("Kraken pair %s not found when valuing Earn wallet", pair_alt)
+        _unknown_pairs[pair_alt] = time.monotonic()
+        return None
+    except Exception:
+        logger.exception(
+            "Error fetching Kraken price for %s when valuing Earn wallet",
+            pair_alt,
+        )
+        return None
+
+    _unknown_pairs.pop(pair_alt, None)
+
+    if not ticker:
+        logger.warning("No ticker data returned for Kraken pair %s", pair_alt)
+        return None
+
+    try:
+        return _ticker_last_price(ticker[next(iter(ticker))])
+    except Exception:
+        logger.exception(
+            "Unexpected ticker format for pair %s when valuing Earn wallet",
+            pair_alt,
+        )
+        return None
+
+
+def _get_kraken_prices(
+    market: KrakenMarket, underlyings, cfg: Config
+) -> dict[str, float]:
+    """Return {underlying: price in base_alt} using one batched Ticker request.
+
+    Kraken's public Ticker endpoint accepts a comma-separated pair list, so all
+    prices come back in a single round-trip. If the batched call fails (e.g.
+    one unknown pair rejects the whole request), or some pairs can't be matched
+    in the response, fall back to one request per missing pair.
+
+    Prices fetched within the last cfg.kraken_ticker_ttl_seconds are served
+    from _ticker_cache; only the rest go to Kraken. Pairs Kraken has called
+    unknown are never put in the batch (one of them would reject it); they are
+    retried on their own, at most once per TTL.
+    """
+    base_asset = cfg.kraken_base_asset
+    base_alt = cfg.kraken_base_alt
+
+    prices: dict[str, float] = {}
+    now = time.monotonic()
+    ttl = cfg.kraken_ticker_ttl_seconds
+    to_fetch = set()
+    retry_unknown = set()
+    for underlying in underlyings:
+        pair = f"{underlying}{base_alt}"
+        hit = _ticker_cache.get(pair)
+        if hit and now - hit[1] < ttl:
+            prices[underlying] = hit[0]
+        elif pair not in _unknown_pairs:
+            to_fetch.add(underlying)
+        elif now - _unknown_pairs[pair] >= ttl:
+            retry_unknown.add(underlying)
+
+    fetched = to_fetch | retry_unknown
+    for underlying in sorted(retry_unknown):
+        price = _get_kraken_price(market, underlying, base_alt)
+        if price is not None:
+            prices[underlying] = price
+
+    underlyings = to_fetch
+    if not underlyings:
+        _cache_prices(prices, fetched, base_alt)
+        return prices
+
+    pairs = ",".join(f"{u}{base_alt}" for u in sorted(underlyings))
+    try:
+        ticker = market.get_ticker(pair=pairs)
+    except (KrakenUnknownAssetError, KrakenUnknownAssetPairError):
+        if len(underlyings) == 1:
+            # The batch was exactly one pair, so we already know it's unknown.
+            logger.warning("Kraken pair %s not found when valuing Earn wallet", pairs)
+            _unknown_pairs[pairs] = time.monotonic()
+            _cache_prices(prices, fetched, base_alt)
+            return prices
+        logger.warning(
+            "Batched Kraken ticker request hit an unknown pair; "
+            "falling back to per-pair"
+        )
+        ticker = {}
+    except Exception as exc:
+        logger.warning(
+            "Batched Kraken ticker request failed (%s); falling back to per-pair",
+            exc,
+        )
+        ticker = {}
+
+    ticker = ticker or {}
+    for key, entry in ticker.items():
+        if len(underlyings) == 1 and len(ticker) == 1:
+            # One pair in, one entry out: no need to match the canonical name.
+            underlying = next(iter(underlyings))
+        else:
+            underlying = _match_ticker_key(key, underlyings, base_asset, base_alt)
+        if underlying is None:
+            continue
+        try:
+            prices[underlying] = _ticker_last_price(entry)
+        except Exception:
+            logger.exception(
+                "Unexpected ticker format for pair %s when valuing Earn wallet",
+                key,
+            )
+
+    # A one-pair batch was already the per-pair request; don't send it twice.
+    missing = underlyings - prices.keys() if len(underlyings) > 1 else set()
+    for underlying in sorted(missing):
+        price = _get_kraken_price(market, underlying, base_alt)
+        if price is not None:
+            prices[underlying] = price
+
+    _cache_prices(prices, fetched, base_alt)
+    return prices
+
+
+def _cache_prices(prices: dict[str, float], fetched, base_alt: str) -> None:
+    """Store the prices just fetched from Kraken in _ticker_cache."""
+    now = time.monotonic()
+    for underlying in fetched & prices.keys():
+        _ticker_cache[f"{underlying}{base_alt}"] = (prices[underlying], now)
+
+
+# Balance suffixes that make up the dedicated Earn wallet. Auto Earn ('.F')
+# is deliberately excluded.
+_EARN_SUFFIXES = frozenset({".B", ".S", ".M"})
+
+# The balance method name differs across python-kraken-sdk versions; resolve
+# it once against the class rather than probing on every call.
+_KRAKEN_BALANCE_METHOD_NAME = next(
+    (
+        name
+        for name in ("get_account_balance", "get_balance", "get_balances")
+        if getattr(KrakenUser, name, None) is not None
+    ),
+    None,
+)
+
+
+def get_kraken_earn_wallet_value(
+    user: KrakenUser, market: KrakenMarket, cfg: Config
+) -> float:
+    """Return the total value (in the base asset) of Kraken *Earn wallet* balances.
 
     Strategy:
     - Query balances from Kraken (Balance / BalanceEx via python-kraken-sdk User).
@@ -173,38 +527,28 @@ def get_kraken_earn_wallet_value(user: KrakenUser, base_asset: str) -> float:
     - Convert each such asset into base_asset using spot tickers.
     """
     # Fetch balances using whatever method the installed SDK exposes
+    if _KRAKEN_BALANCE_METHOD_NAME is None:
+        logger.warning(
+            "Kraken User client has no recognized balance method; "
+            "Earn wallet value will be reported as 0."
+        )
+        return 0.0
+
     try:
-        try:
-            balances = user.get_account_balance()  # type: ignore[attr-defined]
-        except AttributeError:
-            try:
-                balances = user.get_balance()  # type: ignore[attr-defined]
-            except AttributeError:
-                try:
-                    balances = user.get_balances()  # type: ignore[attr-defined]
-                except AttributeError:
-                    logger.warning(
-                        "Kraken User client has no recognized balance method; "
-                        "Earn wallet value will be reported as 0."
-                    )
-                    return 0.0
+        balances = getattr(user, _KRAKEN_BALANCE_METHOD_NAME)()
     except Exception:
         logger.exception("Error fetching Kraken balances for Earn wallet calculation")
         return 0.0
 
     # Normalize balances into {asset: float_amount}, keeping only Earn-wallet suffixes
-    earn_suffixes = (".B", ".S", ".M")
     earn_balances: dict[str, float] = {}
 
     for asset, entry in balances.items():
-        # Skip Auto Earn (.F) explicitly.
-        if isinstance(asset, str) and asset.endswith(".F"):
-            continue
-
         if not isinstance(asset, str):
             continue
 
-        if not any(asset.endswith(sfx) for sfx in earn_suffixes):
+        # Auto Earn (.F) isn't in the set, so it's skipped here too.
+        if asset[-2:] not in _EARN_SUFFIXES:
             continue
 
         # Entry may be a simple string (Balance) or a dict (BalanceEx).
@@ -227,22 +571,22 @@ def get_kraken_earn_wallet_value(user: KrakenUser, base_asset: str) -> float:
         return 0.0
 
     # Convert these Earn balances into base_asset using Market tickers.
-    market = KrakenMarket()  # unauthenticated is fine for public price data
-    base_alt = _kraken_base_alt_name(base_asset)
+    base_asset = cfg.kraken_base_asset
+    base_alt = cfg.kraken_base_alt
+
+    # Map legacy / derived tickers to a priceable underlying.
+    # Example: ETH2 represents staked ETH; treat it as normal ETH.
+    underlying_aliases = {
+        "ETH2": "ETH",
+        "XETH2": "ETH",
+    }
 
     total_value = 0.0
-    price_cache: dict[str, float] = {}
+    holdings: list[tuple[str, str, float]] = []
 
     for asset_with_suffix, amount in earn_balances.items():
         # Strip suffix: 'DOT.B' -> 'DOT', 'ETH2.S' -> 'ETH2'
         underlying_raw = asset_with_suffix.split(".", 1)[0]
-
-        # Map legacy / derived tickers to a priceable underlying.
-        # Example: ETH2 represents staked ETH; treat it as normal ETH. 
-        underlying_aliases = {
-            "ETH2": "ETH",
-            "XETH2": "ETH",
-        }
         underlying = underlying_aliases.get(underlying_raw, underlying_raw)
 
         # If underlying is already the base asset (ZUSD) or its alt (USD),
@@ -251,58 +595,30 @@ def get_kraken_earn_wallet_value(user: KrakenUser, base_asset: str) -> float:
             total_value += amount
             continue
 
-        # Cache prices per underlying to avoid repeated ticker calls.
-        if underlying in price_cache:
-            price = price_cache[underlying]
-        else:
-            pair_alt = f"{underlying}{base_alt}"  # e.g. 'DOTUSD', 'ETHUSD'
-            try:
-                ticker = market.get_ticker(pair=pair_alt)
-            except (KrakenUnknownAssetError, KrakenUnknownAssetPairError):
-                logger.warning(
-                    "Kraken pair %s/%s not found when valuing Earn wallet; "
-                    "skipping asset %s",
-                    underlying,
-                    base_asset,
-                    asset_with_suffix,
-                )
-                continue
-            except Exception:
-                logger.exception(
-                    "Error fetching Kraken price for %s/%s when valuing Earn wallet",
-                    underlying,
-                    base_asset,
-                )
-                continue
-
-            if not ticker:
-                logger.warning(
-                    "No ticker data returned for Kraken pair %s; "
-                    "skipping asset %s from Earn wallet",
-                    pair_alt,
-                    asset_with_suffix,
-                )
-                continue
+        holdings.append((asset_with_suffix, underlying, amount))
 
-            try:
-                first_key = next(iter(ticker))
-                last_trade_close = ticker[first_key]["c"][0]
-                price = float(last_trade_close)
-            except Exception:
-                logger.exception(
-                    "Unexpected ticker format for pair %s when valuing Earn wallet",
-                    pair_alt,
-                )
-                continue
-
-            price_cache[underlying] = price
+    prices = _get_kraken_prices(
+        market,
+        {underlying for _, underlying, _ in holdings},
+        cfg,
+    )
 
+    for asset_with_suffix, underlying, amount in holdings:
+        price = prices.get(underlying)
+        if price is None:
+            logger.warning(
+                "No Kraken price for %s/%s; skipping asset %s from Earn wallet",
+                underlying,
+                base_asset,
+                asset_with_suffix,
+            )
+            continue
         total_value += amount * price
 
     return total_value
 
 
-def get_kraken_snapshot():
+def get_kraken_snapshot(cfg: Config):
     """Return account value + available funds for Kraken, plus Earn wallet value.
 
     Uses python-kraken-sdk's User.get_trade_balance() for:
@@ -311,16 +627,14 @@ def get_kraken_snapshot():
 
     And computes Earn wallet value separately (excluding Auto Earn) using balances.
     """
-    api_key = os.getenv("KRAKEN_API_KEY")
-    api_secret = os.getenv("KRAKEN_API_SECRET")
+    user = _kraken_user(cfg)
 
-    if not api_key or not api_secret:
+    if user is None:
         logger.info("Skipping Kraken: missing KRAKEN_API_KEY / KRAKEN_API_SECRET")
         return None
 
-    base_asset = os.getenv("KRAKEN_BASE_ASSET", "ZUSD")
+    base_asset = cfg.kraken_base_asset
 
-    user = KrakenUser(key=api_key, secret=api_secret)
     tb = user.get_trade_balance(asset=base_asset)
 
     equivalent_balance = float(tb.get("eb", 0.0))
@@ -328,7 +642,7 @@ def get_kraken_snapshot():
 
     earn_wallet_value = 0.0
     try:
-        earn_wallet_value = get_kraken_earn_wallet_value(user, base_asset)
+        earn_wallet_value = get_kraken_earn_wallet_value(user, _kraken_market(), cfg)
     except Exception:
         logger.exception("Error computing Kraken Earn wallet value")
         earn_wallet_value = 0.0
@@ -347,7 +661,7 @@ def get_kraken_snapshot():
     return snapshot
 
 
-def get_oanda_snapshot():
+def get_oanda_snapshot(cfg: Config):
     """Return account value + available funds for OANDA, or None if not configured.
 
     Uses oandapyV20 AccountSummary endpoint.
@@ -355,15 +669,13 @@ def get_oanda_snapshot():
     - account_value   -> 'NAV' (Net Asset Value)
     - available_funds -> 'marginAvailable'
     """
-    api_key = os.getenv("OANDA_API_KEY")
-    account_id = os.getenv("OANDA_ACCOUNT_ID")
-    environment = os.getenv("OANDA_ENV", "practice")  # 'practice' or 'live'
+    client = _oanda_client(cfg)
+    account_id = cfg.oanda_account_id
 
-    if not api_key or not account_id:
+    if client is None or not account_id:
         logger.info("Skipping OANDA: missing OANDA_API_KEY / OANDA_ACCOUNT_ID")
         return None
 
-    client = oandapyV20.API(access_token=api_key, environment=environment)
     r = oanda_accounts.AccountSummary(account_id)
     client.request(r)
     account = r.response["account"]
@@ -383,50 +695,216 @@ def get_oanda_snapshot():
 # ---------- Sheet writing ----------
 
 
+_snapshot_fields = itemgetter("name", "currency", "account_value", "available_funds")
+
+
 def build_rows(snapshots, timestamp_str):
     """Convert snapshots into rows for the sheet starting at row 5.
 
     Column A: label of datapoint
     Column B: numeric value
     Column C: updated_at (Mountain time)
+
+    A snapshot served from the fallback cache carries its own "updated_at"
+    (when it was actually fetched), which is used instead of timestamp_str.
     """
     rows = []
+    extend = rows.extend
     for snap in snapshots:
         if not snap:
             continue
 
-        name = snap["name"]
-        currency = snap["currency"]
-        acct_val = snap["account_value"]
-        avail = snap["available_funds"]
-
-        label_value = f"{name}: Account Value ({currency})"
-        label_available = f"{name}: Available Funds ({currency})"
+        name, currency, acct_val, avail = _snapshot_fields(snap)
+        updated_at = snap.get("updated_at", timestamp_str)
 
-        rows.append([label_value, acct_val, timestamp_str])
-        rows.append([label_available, avail, timestamp_str])
+        extend(
+            (
+                [f"{name}: Account Value ({currency})", acct_val, updated_at],
+                [f"{name}: Available Funds ({currency})", avail, updated_at],
+            )
+        )
 
         # Optional: Kraken Earn wallet value (excluding Auto Earn)
         earn_wallet_value = snap.get("earn_wallet_value")
         if earn_wallet_value is not None:
             label_earn = f"{name}: Earn Wallet Value ({currency})"
-            rows.append([label_earn, earn_wallet_value, timestamp_str])
+            rows.append([label_earn, earn_wallet_value, updated_at])
 
     return rows
 
 
-def update_sheet_once():
+# ---------- Snapshot fetching ----------
+
+# Last successful snapshot per broker as (snapshot, time.monotonic(), Mountain
+# timestamp string of the fetch), plus consecutive failure counts and the
+# earliest time we'll call a failing broker again. During a provider incident
+# this serves the recent snapshot instead of hammering a flaky API every tick.
+_last_good: dict[str, tuple[dict, float, str]] = {}
+_fail_counts: dict[str, int] = {}
+_retry_at: dict[str, float] = {}
+
+FALLBACK_MAX_AGE_SECONDS = 300
+BACKOFF_BASE_SECONDS = 60
+BACKOFF_MAX_SECONDS = 900
+
+
+def _with_fallback(name: str, fn, cfg: Config):
+    """Call a blocking snapshot fn, serving the last good snapshot on failure.
+
+    After a failure the broker is not called again for
+    min(60 * 2**(failures - 1), 900) seconds. Meanwhile, and on the failure
+    itself, the last good snapshot is returned if it's under 5 minutes old;
+    otherwise None (while backing off) or the original exception. A cached
+    snapshot is returned as a copy with "updated_at" set to its fetch time.
+    """
+    now = time.monotonic()
+    cached = _last_good.get(name)
+    fresh = None
+    if cached and now - cached[1] < FALLBACK_MAX_AGE_SECONDS:
+        fresh = dict(cached[0], updated_at=cached[2])
+
+    retry_at = _retry_at.get(name, 0.0)
+    if now < retry_at:
+        if fresh is None:
+            logger.warning(
+                "Skipping %s until retry in %.0fs; no recent snapshot to serve",
+                name,
+                retry_at - now,
+            )
+        else:
+            logger.info(
+                "%s is backing off after failures; using cached snapshot", name
+            )
+        return fresh
+
+    try:
+        snapshot = fn(cfg)
+    except Exception:
+        fails = _fail_counts.get(name, 0) + 1
+        _fail_counts[name] = fails
+        delay = min(BACKOFF_BASE_SECONDS * 2 ** (fails - 1), BACKOFF_MAX_SECONDS)
+        _retry_at[name] = now + delay
+        if fresh is None:
+            raise
+        logger.warning(
+            "%s snapshot failed (%d in a row); serving cached snapshot, "
+            "retrying in %ss",
+            name,
+            fails,
+            delay,
+            exc_info=True,
+        )
+        return fresh
+
+    _fail_counts.pop(name, None)
+    _retry_at.pop(name, None)
+    if snapshot is not None:
+        _last_good[name] = (snapshot, now, get_mountain_timestamp())
+    return snapshot
+
+
+# In-flight snapshot fetches keyed by broker. A second caller asking for the
+# same broker while a fetch is running awaits that fetch instead of sending
+# its own request.
+_inflight: dict[str, asyncio.Task] = {}
+
+
+def _coalesced(ident: str):
+    """Decorate a coroutine so concurrent calls share one in-flight run.
+
+    Calls are coalesced on ident alone, not on arguments.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args):
+            task = _inflight.get(ident)
+            if task is None:
+                task = asyncio.ensure_future(fn(*args))
+                _inflight[ident] = task
+                task.add_done_callback(lambda _: _inflight.pop(ident, None))
+            # Shield so one waiter being cancelled doesn't cancel the others.
+            return await asyncio.shield(task)
+
+        return wrapper
+
+    return decorator
+
+
+@_coalesced("alpaca")
+async def _alpaca_snapshot_async(cfg: Config):
+    return await asyncio.to_thread(
+        _with_fallback, "Alpaca", get_alpaca_snapshot, cfg
+    )
+
+
+@_coalesced("kraken")
+async def _kraken_snapshot_async(cfg: Config):
+    return await asyncio.to_thread(
+        _with_fallback, "Kraken", get_kraken_snapshot, cfg
+    )
+
+
+@_coalesced("oanda")
+async def _oanda_snapshot_async(cfg: Config):
+    return await asyncio.to_thread(
+        _with_fallback, "OANDA", get_oanda_snapshot, cfg
+    )
+
+
+async def fetch_snapshots(cfg: Config):
+    """Fetch all broker snapshots concurrently.
+
+    Each broker SDK is blocking, so every call runs in a worker thread and the
+    three round-trips overlap. A broker that fails with no recent snapshot to
+    fall back on is logged and reported as None so the others still get
+    written.
+    """
+    fetchers = {
+        "Alpaca": _alpaca_snapshot_async,
+        "Kraken": _kraken_snapshot_async,
+        "OANDA": _oanda_snapshot_async,
+    }
+    results = await asyncio.gather(
+        *(fetch(cfg) for fetch in fetchers.values()),
+        return_exceptions=True,
+    )
+
+    snapshots = []
+    for name, result in zip(fetchers, results):
+        if isinstance(result, BaseException):
+            logger.warning(
+                "%s snapshot failed: %r", name, result, exc_info=result
+            )
+            snapshots.append(None)
+        else:
+            snapshots.append(result)
+    return snapshots
+
+
+# Hash of the label/value columns from the last successful write. Lets us skip
+# the Sheets write (and its quota cost) on ticks where nothing changed.
+_last_rows_hash = None
+
+# Last row of the block we wrote, so a shorter block (e.g. a broker dropped
+# out) can blank the leftover rows instead of leaving stale data below it.
+_last_end_row = None
+
+
+def _rows_hash(rows) -> str:
+    """Hash the label + value columns of rows, ignoring the timestamp column."""
+    return hashlib.blake2b(repr([r[:2] for r in rows]).encode()).hexdigest()
+
+
+async def update_sheet_once(cfg: Config):
     """Fetch all snapshots + update the Google Sheet once."""
-    gc = get_gspread_client()
-    ws = get_dashboard_worksheet(gc)
+    global _last_rows_hash, _last_end_row
+
+    ws = get_cached_worksheet(cfg)
 
     timestamp_str = get_mountain_timestamp()
 
-    snapshots = [
-        get_alpaca_snapshot(),
-        get_kraken_snapshot(),
-        get_oanda_snapshot(),
-    ]
+    snapshots = await fetch_snapshots(cfg)
 
     rows = build_rows(snapshots, timestamp_str)
 
@@ -439,13 +917,45 @@ def update_sheet_once():
     end_row = start_row + len(rows) - 1
     cell_range = f"A{start_row}:C{end_row}"
 
-    logger.info("Updating range %s with %d rows", cell_range, len(rows))
-    # Use named arguments to avoid the DeprecationWarning from gspread.
-    ws.update(
-        range_name=cell_range,
-        values=rows,
-        value_input_option="USER_ENTERED",
-    )
+    # Rows from a cached snapshot keep their own fetch time in column C, so
+    # they must never go through the "stamp everything with now" heartbeat.
+    served_cached = any(snap and "updated_at" in snap for snap in snapshots)
+
+    rows_hash = _rows_hash(rows)
+    if rows_hash == _last_rows_hash and not served_cached:
+        # Values unchanged: only refresh the updated_at column as a heartbeat.
+        heartbeat_range = f"C{start_row}:C{end_row}"
+        logger.info("Account values unchanged; refreshing %s", heartbeat_range)
+        data = [(heartbeat_range, [[timestamp_str]] * len(rows))]
+    else:
+        logger.info("Updating range %s with %d rows", cell_range, len(rows))
+        data = [(cell_range, rows)]
+
+    if _last_end_row is not None and _last_end_row > end_row:
+        tail_range = f"A{end_row + 1}:C{_last_end_row}"
+        logger.info("Clearing leftover rows %s", tail_range)
+        data.append((tail_range, [["", "", ""]] * (_last_end_row - end_row)))
+
+    # Every write goes through one spreadsheets.values.batchUpdate request;
+    # new ranges are added to `data` rather than issued as separate calls.
+    try:
+        ws.spreadsheet.values_batch_update(
+            {
+                "valueInputOption": "USER_ENTERED",
+                "data": [
+                    {"range": absolute_range_name(ws.title, rng), "values": values}
+                    for rng, values in data
+                ],
+            }
+        )
+    except gspread.exceptions.APIError as exc:
+        if _is_auth_error(exc):
+            logger.warning("Google Sheets auth error; rebuilding client next update")
+            reset_cached_worksheet()
+        raise
+
+    _last_rows_hash = rows_hash
+    _last_end_row = end_row
 
 
 # ---------- Main loop ----------
@@ -457,22 +967,19 @@ def main():
     If UPDATE_INTERVAL_SECONDS is set, run in a loop with that interval.
     Otherwise, perform a single update and exit.
     """
-    interval_str = os.getenv("UPDATE_INTERVAL_SECONDS")
-    if not interval_str:
+    cfg = Config.from_env()
+
+    interval = cfg.update_interval_seconds
+    if interval is None:
         logger.info("Running single update...")
-        update_sheet_once()
+        asyncio.run(update_sheet_once(cfg))
         logger.info("Done.")
         return
 
-    try:
-        interval = int(interval_str)
-    except ValueError:
-        raise RuntimeError("UPDATE_INTERVAL_SECONDS must be an integer (seconds)")
-
     logger.info("Running in loop every %s seconds", interval)
     while True:
         try:
-            update_sheet_once()
+            asyncio.run(update_sheet_once(cfg))
         except Exception:
             logger.exception("Error while updating sheet")
         time.sleep(interval)